@@ -1,14 +1,32 @@
 from aiohttp import ClientSession, ClientError, ClientResponseError
 from typing import Optional, Dict, List, Any, Tuple
-from utils.helpers import HtmlParser, HtmlPageScraper
-from utils.helpers import load_input, save_data
+from utils.helpers import HtmlParser, HtmlPageScraper, ContractMatch
+from utils.helpers import load_input, SaveBuffer
 from logs.custom_logging import setup_logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import logging, time, asyncio, random
 import traceback
 
 
 logger = setup_logging(console_level=logging.DEBUG)
 
+
+# ==========================================
+# PROCESS POOL PARSING
+# ==========================================
+# Compiled XPath objects can't be pickled, so each worker process builds its own
+# parser once and the page parse is a module-level function
+_worker_html_parser: Optional[HtmlParser] = None
+
+def _init_parse_worker() -> None:
+    """Build the HtmlParser reused for every page parsed in this worker process."""
+    global _worker_html_parser
+    _worker_html_parser = HtmlParser()
+
+def _parse_final_page(html_str: bytes) -> Optional[Dict[str, Any]]:
+    """Parse a contract detail page with the worker process's HtmlParser."""
+    return _worker_html_parser.final_page_parser(html_str)
+
 class MySuperFastScraper:
     """
     Fast asynchronous scraper for contract information using aiohttp and reverse engineering techniques.
@@ -17,14 +35,26 @@ class MySuperFastScraper:
     with proper error handling, retries, and rate limiting.
     """
     
-    def __init__(self, search_terms: List[str], batch_size: int = 50, max_retries:int = 2):
+    def __init__(self, search_terms: List[str], batch_size: int = 50, max_retries:int = 2,
+                 parse_workers: int = 4, parse_processes: bool = False, list_pages: int = 0,
+                 page_cache_dir: Optional[str] = None, save_buffer: Optional[SaveBuffer] = None):
         """
         Initialize the scraper with search terms and helper classes.
         
         Args:
             search_terms: List of contract terms to search for
+            parse_workers: Threads (or processes) used to parse detail pages off the event loop
+            parse_processes: Parse in worker processes instead of threads, so parsing uses every
+                CPU core; only pays off when parsing, not the network, is the bottleneck
+            list_pages: Pages of the unfiltered contract listing to prefetch and match terms
+                against before searching term by term (0 disables the prefetch)
+            page_cache_dir: Folder to keep detail pages in, so unchanged pages are revalidated
+                instead of downloaded again on the next run (None disables the cache)
+            save_buffer: Open SaveBuffer each parsed contract is handed to as soon as it's
+                ready, instead of saving everything after the run (None keeps results in memory only)
         """
-        self.html_page_scraper = HtmlPageScraper()
+        self.html_page_scraper = HtmlPageScraper(limit=batch_size, limit_per_host=batch_size,
+                                                 max_concurrency=batch_size, page_cache_dir=page_cache_dir)
         self.html_parser = HtmlParser()
         self.search_terms = search_terms
         self.logger = logger
@@ -32,29 +62,29 @@ class MySuperFastScraper:
         self.max_retries = max_retries
         self.base_delay = 1.0
         self.max_delay = 3.0
+        self.parse_workers = parse_workers
+        self.parse_processes = parse_processes
+        self.list_pages = list_pages
+        self.save_buffer = save_buffer
         
     async def _fetch_with_retry(self, session: ClientSession, term: str = None, 
-                              matched_contract: Dict[str, str] = None) -> Optional[str]:
+                              matched_contract: ContractMatch = None) -> Optional[bytes]:
         """
         Fetch HTML with retry logic and adaptive delays.
         
         Args:
             session: Active ClientSession
             term: Contract number to search for
-            matched_contract: Contract details for final page
+            matched_contract: Contract name and CID for final page
             
         Returns:
-            HTML content as string or None if all retries failed
+            HTML content as UTF-8 bytes or None if all retries failed
         """
         current_delay = self.base_delay
         retries = 0
         
         while retries < self.max_retries:
             try:
-                # Add small random delay for initial requests to avoid detection
-                delay = random.uniform(current_delay, current_delay + 1)
-                await asyncio.sleep(delay)
-                
                 if term:
                     html_result = await self.html_page_scraper.request_html(session, contract_name=term)
                 elif matched_contract:
@@ -76,86 +106,165 @@ class MySuperFastScraper:
                     retries += 1
                     current_delay = min(current_delay * 3, self.max_delay * 2)  # More aggressive backoff
                     self.logger.warning(f"⚠️ Rate limited (429), retrying in {current_delay:.2f}s")
-                    await asyncio.sleep(current_delay)
                 else:
                     self.logger.error(f"❌ HTTP error {e.status}: {str(e)}")
                     retries += 1
                     current_delay = min(current_delay * 2, self.max_delay)
-                    await asyncio.sleep(current_delay)
             except ClientError as e:
                 self.logger.error(f"❌ Client error: {str(e)}")
                 retries += 1
                 current_delay = min(current_delay * 2, self.max_delay)
-                await asyncio.sleep(current_delay)
             except Exception as e:
                 self.logger.error(f"❌ Unexpected error during fetch: {str(e)}")
                 self.logger.debug(traceback.format_exc())
                 retries += 1
                 current_delay = min(current_delay * 2, self.max_delay)
-                await asyncio.sleep(current_delay)
+            
+            # Back off with jitter only between attempts; the first attempt fires immediately
+            if retries < self.max_retries:
+                await asyncio.sleep(random.uniform(current_delay, current_delay + 1))
                 
         self.logger.error(f"❌ All {self.max_retries} fetch attempts failed")
         return None
         
-    async def scrape_contract_matches(self) -> List[Dict[str, str]]:
+    async def _prefetch_listed_contracts(self, session: ClientSession) -> Dict[str, ContractMatch]:
+        """
+        Fetch the first list_pages pages of the contract listing concurrently and index their rows.
+        
+        Args:
+            session: Active ClientSession shared with the search phase
+            
+        Returns:
+            Dictionary mapping upper-cased contract name to its match
+        """
+        page_htmls = await asyncio.gather(*(
+            self.html_page_scraper.request_list(session, page=page)
+            for page in range(1, self.list_pages + 1)
+        ))
+        
+        listed_contracts = {}
+        for page_html in page_htmls:
+            if page_html:
+                listed_contracts.update(self.html_parser.search_list_parser(page_html))
+        return listed_contracts
+
+    async def _search_term(self, session: ClientSession, term: str,
+                           matched_contracts: List[ContractMatch],
+                           mismatched_contracts: List[Dict[str, None]]) -> None:
+        """
+        Fetch and parse the search page for one term, recording the outcome as soon as it arrives.
+        
+        Args:
+            session: Active ClientSession shared with the detail phase
+            term: Contract number to search for
+            matched_contracts: List the match is appended to
+            mismatched_contracts: List the term is appended to when the page has no match
+        """
+        html_result = await self._fetch_with_retry(session, term=term)
+        if not html_result:
+            self.logger.warning(f"⚠️ Failed to fetch search page for: {term}")
+            return
+        
+        match_contract = self.html_parser.search_page_parser(html_result, term)
+        if match_contract:
+            self.logger.debug(f"Found match for contract: {term}")
+            matched_contracts.append(match_contract)
+        else:
+            self.logger.warning(f"⚠️  No match found for contract: {term}")
+            mismatched_contracts.append({term: match_contract})
+
+    async def scrape_contract_matches(self, session: ClientSession
+                                      ) -> Tuple[List[ContractMatch], List[Dict[str, None]]]:
         """
         Search for matches of all contract terms.
         
+        Args:
+            session: Active ClientSession shared with the detail phase
+            
         Returns:
-            List of matched contracts with their details
+            Tuple of the matched contracts and the terms whose search page had no match
         """
         matched_contracts = []
         mismatched_contracts = []
         
-        # Use a single session for all search requests
-        async with ClientSession() as session:
-            try:
-                # Process search terms in batches to control concurrency
-                batch_size = self.batch_size  # Adjust based on target site's limits
-                for i in range(0, len(self.search_terms), batch_size):
-                    batch = self.search_terms[i:i+batch_size]
-                    batch_tasks = []
-                    
-                    # Create tasks for this batch
-                    for term in batch:
-                        task = asyncio.create_task(self._fetch_with_retry(session, term=term))
-                        batch_tasks.append((term, task))
-                    
-                    # Process results from this batch
-                    for term, task in batch_tasks:
-                        try:
-                            html_result = await task
-                            if html_result:
-                                match_contract = self.html_parser.search_page_parser(html_result, term)
-                                if match_contract:
-                                    self.logger.debug(f"Found match for contract: {term}")
-                                    matched_contracts.append(match_contract)
-                                else:
-                                    self.logger.warning(f"⚠️  No match found for contract: {term}")
-                                    mismatched_contracts.append({term: match_contract})
-                            else:
-                                self.logger.warning(f"⚠️ Failed to fetch search page for: {term}")
-                        except Exception as e:
-                            self.logger.error(f"❌ Error processing search for {term}: {str(e)}")
-                            self.logger.debug(traceback.format_exc())
-                    
-                    # Small delay between batches to avoid overwhelming the server
-                    await asyncio.sleep(random.uniform(0.5, 1.5))
+        try:
+            # Resolve what we can from the prefetched listing; only the rest are searched term by term
+            pending_terms = self.search_terms
+            if self.list_pages:
+                listed_contracts = await self._prefetch_listed_contracts(session)
+                pending_terms = []
+                for term in self.search_terms:
+                    listed_match = listed_contracts.get(term.upper())
+                    if listed_match:
+                        matched_contracts.append(listed_match)
+                    else:
+                        pending_terms.append(term)
+                self.logger.info(f"Matched {len(matched_contracts)} terms from {self.list_pages} list pages, "
+                                 f"searching {len(pending_terms)} individually")
+
+            # Process search terms in batches to control concurrency
+            batch_size = self.batch_size  # Adjust based on target site's limits
+            for i in range(0, len(pending_terms), batch_size):
+                batch = pending_terms[i:i+batch_size]
                 
-                self.logger.info(f"Found {len(matched_contracts)} matches from {len(self.search_terms)} terms")
-                return matched_contracts, mismatched_contracts
+                # Each coroutine handles its own result as soon as its page arrives
+                results = await asyncio.gather(
+                    *(self._search_term(session, term, matched_contracts, mismatched_contracts) for term in batch),
+                    return_exceptions=True
+                )
+                for term, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        self.logger.error(f"❌ Error processing search for {term}: {str(result)}")
+                        self.logger.debug("".join(traceback.format_exception(result)))
                 
-            except Exception as e:
-                self.logger.error(f"❌ Error during contract matching: {str(e)}")
-                self.logger.debug(traceback.format_exc())
-                return []
+                # Small delay between batches to avoid overwhelming the server
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+            
+            self.logger.info(f"Found {len(matched_contracts)} matches from {len(self.search_terms)} terms")
+            return matched_contracts, mismatched_contracts
+            
+        except Exception as e:
+            self.logger.error(f"❌ Error during contract matching: {str(e)}")
+            self.logger.debug(traceback.format_exc())
+            return [], []
             
-    async def scrape_contract_details(self, matched_contracts: List[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+    async def _fetch_contract_details(self, session: ClientSession, matched_contract: ContractMatch,
+                                      parse_executor: Executor,
+                                      final_result: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Fetch and parse the detail page for one matched contract.
+        
+        Args:
+            session: Active ClientSession shared with the search phase
+            matched_contract: Contract name and CID to fetch
+            parse_executor: Thread or process pool the page is parsed in
+            final_result: Dictionary the parsed details are stored in, keyed by contract name
+        """
+        contract_name = matched_contract.name
+        html_result = await self._fetch_with_retry(session, matched_contract=matched_contract)
+        if not html_result:
+            self.logger.warning(f"⚠️ Failed to fetch details for: {contract_name}")
+            return
+        
+        loop = asyncio.get_running_loop()
+        parse_page = _parse_final_page if isinstance(parse_executor, ProcessPoolExecutor) else self.html_parser.final_page_parser
+        final_page_dict = await loop.run_in_executor(parse_executor, parse_page, html_result)
+        if final_page_dict:
+            self.logger.debug(f"Parsed details for: {contract_name}")
+            final_result[contract_name] = final_page_dict
+            if self.save_buffer is not None:
+                await self.save_buffer.add(contract_name, final_page_dict)
+        else:
+            self.logger.warning(f"⚠️ Failed to parse details for: {contract_name}")
+
+    async def scrape_contract_details(self, session: ClientSession,
+                                      matched_contracts: List[ContractMatch]) -> Dict[str, Dict[str, Any]]:
         """
         Fetch and parse detailed information for matched contracts.
         
         Args:
-            matched_contracts: List of matched contract dictionaries
+            session: Active ClientSession shared with the search phase
+            matched_contracts: List of matched contracts (name and CID)
             
         Returns:
             Dictionary mapping contract names to their parsed details
@@ -165,72 +274,58 @@ class MySuperFastScraper:
             self.logger.warning("No matched contracts to process")
             return final_result
             
-        # Use a single session for all detail requests
-        async with ClientSession() as session:
+        # Parse pages in a dedicated pool so lxml work overlaps with network IO instead of blocking the event loop
+        if self.parse_processes:
+            parse_executor = ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_parse_worker)
+        else:
+            parse_executor = ThreadPoolExecutor(max_workers=self.parse_workers)
+        with parse_executor:
             # Process contracts in batches
             batch_size = self.batch_size  
             for i in range(0, len(matched_contracts), batch_size):
                 batch = matched_contracts[i:i+batch_size]
-                batch_tasks = []
-                
-                # Create tasks for this batch
-                for matched_contract in batch:
-                    contract_name = next(iter(matched_contract.keys()))
-                    contract_cid = matched_contract[contract_name]
-                    
-                    # Format contract info for request_html method
-                    contract_info = {
-                        "contract_name": contract_name,
-                        "contract_cid": contract_cid
-                    }
-                    
-                    task = asyncio.create_task(self._fetch_with_retry(session, matched_contract=contract_info))
-                    batch_tasks.append((contract_name, task))
-                
-                # Process results from this batch
-                for contract_name, task in batch_tasks:
-                    try:
-                        html_result = await task
-                        if html_result:
-
-                            final_page_dict = self.html_parser.final_page_parser(html_result)
-                            if final_page_dict:
-                                self.logger.debug(f"Parsed details for: {contract_name}")
-                                final_result[contract_name] = final_page_dict
-                            else:
-                                self.logger.warning(f"⚠️ Failed to parse details for: {contract_name}")
-                        else:
-                            self.logger.warning(f"⚠️ Failed to fetch details for: {contract_name}")
-                    except Exception as e:
-                        self.logger.error(f"❌ Error processing details for {contract_name}: {str(e)}")
-                        self.logger.debug(traceback.format_exc())
-                
+            
+                # Each coroutine handles its own result as soon as its page arrives
+                results = await asyncio.gather(
+                    *(self._fetch_contract_details(session, matched_contract, parse_executor, final_result)
+                      for matched_contract in batch),
+                    return_exceptions=True
+                )
+                for matched_contract, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        self.logger.error(f"❌ Error processing details for {matched_contract.name}: {str(result)}")
+                        self.logger.debug("".join(traceback.format_exception(result)))
+            
                 # Delay between batches
                 await asyncio.sleep(random.uniform(1.0, 2.0))
-                
+            
         self.logger.info(f"Successfully processed {len(final_result)} of {len(matched_contracts)} contracts")
         return final_result
     
-    async def scrape_contracts(self) -> Dict[str, Dict[str, Any]]:
+    async def scrape_contracts(self) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, None]]]:
         """
         Main entry point for the scraper. Searches for and fetches details for all contracts.
         
         Returns:
-            Dictionary mapping contract names to their parsed details
+            Tuple of a dictionary mapping contract names to their parsed details
+            and the list of terms whose search page had no match
         """
         start_time = time.perf_counter()
         self.logger.info(f"Starting scrape for {len(self.search_terms)} contract terms")
         
         try:
-            # First get all the matches
-            matched_contracts, mismatched_contracts = await self.scrape_contract_matches()
-            
-            if not matched_contracts:
-                self.logger.warning("No matched contracts found")
-                return {}
+            # One pooled session for both phases so keep-alive connections and TLS sessions are reused
+            async with self.html_page_scraper as page_scraper:
+                session = page_scraper.session
+                # First get all the matches
+                matched_contracts, mismatched_contracts = await self.scrape_contract_matches(session)
                 
-            # Then fetch details for all matches
-            final_result = await self.scrape_contract_details(matched_contracts)
+                if not matched_contracts:
+                    self.logger.warning("No matched contracts found")
+                    return {}, mismatched_contracts
+                    
+                # Then fetch details for all matches
+                final_result = await self.scrape_contract_details(session, matched_contracts)
             
             # Calculate and log performance metrics
             end_time = time.perf_counter()
@@ -245,14 +340,15 @@ class MySuperFastScraper:
         except Exception as e:
             self.logger.error(f"❌ Error in main scrape_contracts method: {str(e)}")
             self.logger.debug(traceback.format_exc())
-            return {}
+            return {}, []
         
 
 async def main():
     search_terms = load_input()
-    my_scraper = MySuperFastScraper(search_terms)
-    final_results, mismatched_contracts = await my_scraper.scrape_contracts()
-    save_data(final_results)
+    # Contracts are appended to the output file in batches while the run is still going
+    async with SaveBuffer() as save_buffer:
+        my_scraper = MySuperFastScraper(search_terms, save_buffer=save_buffer)
+        final_results, mismatched_contracts = await my_scraper.scrape_contracts()
 
     if mismatched_contracts:
         import json
@@ -260,4 +356,9 @@ async def main():
             json.dump(mismatched_contracts, f, indent=4, ensure_ascii=False)
             
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop's libuv-based loop is faster for many concurrent sockets; it isn't available on Windows
+    try:
+        from uvloop import run as run_event_loop
+    except ImportError:
+        run_event_loop = asyncio.run
+    run_event_loop(main())
\ No newline at end of file
@@ -2,24 +2,27 @@
 MTA Contracts Scraper - Extracts contract information from the MTA website.
 
 This module provides functionality to scrape contract information from the MTA website.
-It uses SeleniumBase for browser automation and implements a multi-threaded approach
-for concurrent scraping of multiple contract numbers.
+Contracts are first fetched with plain async HTTP requests (no browser); only the
+contracts that fail over HTTP fall back to SeleniumBase browser automation, which
+uses a multi-threaded approach for concurrent scraping of multiple contract numbers.
 """
 
-from seleniumbase import SB
+from aiohttp import ClientSession
+import asyncio
 import time
 from typing import Dict, List, Optional, Tuple, Any
 import logging
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from screeninfo import get_monitors
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import traceback
-from functools import wraps
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from functools import wraps, lru_cache
+from dataclasses import dataclass
 from logs.custom_logging import setup_logging
 
-from utils.helpers import HtmlParser, XpathSelectors
-from utils.helpers import load_input, save_data
+from utils.helpers import HtmlParser, HtmlPageScraper, XpathSelectors
+from utils.helpers import load_input, SaveBuffer
 
 
 # Initialize logger
@@ -48,6 +51,25 @@ def log_execution_time(func):
     return wrapper
 
 
+@lru_cache(maxsize=1)
+def get_primary_monitor():
+    """Return the primary monitor, queried once per process since screeninfo asks the display server."""
+    from screeninfo import get_monitors
+    return get_monitors()[0]
+
+
+# ==========================================
+# BROWSER POOL
+# ==========================================
+
+@dataclass(slots=True)
+class BrowserSession:
+    """A pooled SeleniumBase browser and the state it carries between contracts."""
+    context: Any  # The entered SB context manager; exiting it closes the browser
+    sb: Any
+    search_form_ready: bool = False
+
+
 # ==========================================
 # MAIN CONTRACTS SCRAPER
 # ==========================================
@@ -61,31 +83,48 @@ class ContractsScraper:
     information.
     """
     
-    def __init__(self, max_workers: int = 6, retry_attempts: int = 2):
+    def __init__(self, max_workers: int = 6, retry_attempts: int = 2, http_concurrency: int = 20,
+                 save_buffer: Optional[SaveBuffer] = None):
         """
         Initialize the ContractsScraper.
         
         Args:
             max_workers: Maximum number of concurrent browser sessions
             retry_attempts: Number of retry attempts for browser operations
+            http_concurrency: Maximum number of contracts fetched concurrently over HTTP
+            save_buffer: Open SaveBuffer each scraped contract is handed to as it's collected
+                (None keeps results in memory only)
         """
         self.logger = logger
         self.url = "https://mta.newnycontracts.com/?TN=mta"
         self.max_workers = max_workers
         self.retry_attempts = retry_attempts
+        self.http_concurrency = http_concurrency
         self.html_parser = HtmlParser()
+        self.html_page_scraper = HtmlPageScraper(limit=50, limit_per_host=http_concurrency,
+                                                 max_concurrency=http_concurrency)
         self.xpath_selectors = XpathSelectors()
+        self.save_buffer = save_buffer
 
         # Configure window positioning
         self._configure_window_settings()
         
-        # Track used positions for window placement
-        self.used_positions = set()
+        # Overflow grid cells not yet handed to a window
+        self._free_overflow_cells = []
+        
+        # Idle browsers waiting for a contract, and every browser launched (idle or busy)
+        self._browser_pool = queue.Queue()
+        self._browser_sessions = []
+        self._browser_sessions_lock = threading.Lock()
+        # Set while used as a context manager: browsers then stay open across scrape_contracts calls
+        self._keep_browsers = False
+        # Cleared for the rest of the run if searching again from a previous contract's page fails
+        self._search_form_reusable = True
 
     def _configure_window_settings(self):
         """Configure the window settings based on the screen size."""
         try:
-            self.monitor = get_monitors()[0]
+            self.monitor = get_primary_monitor()
             self.SCREEN_WIDTH = self.monitor.width
             self.SCREEN_HEIGHT = self.monitor.height - 80
         except Exception as e:
@@ -98,6 +137,13 @@ class ContractsScraper:
         self.WINDOW_WIDTH = 600
         self.WINDOW_HEIGHT = 400
         self.WINDOW_PADDING = 10  # Space between windows
+        self.OVERFLOW_STRIDE = 60  # Spacing of the positions used once the grid is full
+
+        # The placement grid depends only on the screen and window sizes, so lay it out once
+        self.PLACEMENT_HEIGHT = self.SCREEN_HEIGHT - 80  # Leave room for the taskbar
+        self.GRID_COLS = max(1, self.SCREEN_WIDTH // (self.WINDOW_WIDTH + self.WINDOW_PADDING))
+        self.GRID_ROWS = max(1, self.PLACEMENT_HEIGHT // (self.WINDOW_HEIGHT + self.WINDOW_PADDING))
+        self.GRID_SLOTS = self.GRID_COLS * self.GRID_ROWS
 
     def get_smart_random_position(self, index: int) -> Tuple[int, int]:
         """
@@ -109,38 +155,29 @@ class ContractsScraper:
         Returns:
             A tuple of (x, y) coordinates for window placement
         """
-        screen_height = self.SCREEN_HEIGHT - 80
-        cols = max(1, self.SCREEN_WIDTH // (self.WINDOW_WIDTH + self.WINDOW_PADDING))
-        rows = max(1, screen_height // (self.WINDOW_HEIGHT + self.WINDOW_PADDING))
-        max_slots = cols * rows
-
         # Use grid positioning for first set of windows
-        if index < max_slots:
-            row = index // cols
-            col = index % cols
+        if index < self.GRID_SLOTS:
+            row, col = divmod(index, self.GRID_COLS)
             x = col * (self.WINDOW_WIDTH + self.WINDOW_PADDING)
             y = row * (self.WINDOW_HEIGHT + self.WINDOW_PADDING)
         else:
-            # For additional windows, find a random position that's not already used
-            for _ in range(50):  # Try up to 50 times to find an unused position
-                x = random.randint(50, self.SCREEN_WIDTH - self.WINDOW_WIDTH - 50)
-                y = random.randint(50, screen_height - self.WINDOW_HEIGHT - 50)
-                
-                # Check if position is sufficiently far from existing windows
-                if all((abs(x - pos_x) > 50 or abs(y - pos_y) > 50) 
-                       for pos_x, pos_y in self.used_positions):
-                    break
-            
-        self.used_positions.add((x, y))
+            # For additional windows, take a random unused cell of a finer overflow grid:
+            # one O(1) swap-pop instead of rejection sampling against every used position
+            if not self._free_overflow_cells:
+                self._free_overflow_cells = [
+                    (x, y)
+                    for x in range(50, self.SCREEN_WIDTH - self.WINDOW_WIDTH - 50 + 1, self.OVERFLOW_STRIDE)
+                    for y in range(50, self.PLACEMENT_HEIGHT - self.WINDOW_HEIGHT - 50 + 1, self.OVERFLOW_STRIDE)
+                ] or [(50, 50)]
+            free_cells = self._free_overflow_cells
+            cell_index = random.randrange(len(free_cells))
+            free_cells[cell_index], free_cells[-1] = free_cells[-1], free_cells[cell_index]
+            x, y = free_cells.pop()
         return x, y
 
 
-    @retry(
-        retry=retry_if_exception_type((Exception,)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True
-    )
+    IFRAME_SWITCH_ATTEMPTS = 3
+
     def _find_and_switch_to_iframe(self, sb, iframe_selector: str, timeout: int = 30) -> None:
         """
         Find and switch to an iframe with retry logic.
@@ -153,16 +190,215 @@ class ContractsScraper:
         Raises:
             Exception: If iframe cannot be found after retries
         """
-        iframe = sb.wait_for_element_visible(iframe_selector, timeout=timeout)
-        if not iframe:
-            raise Exception(f"Iframe not found with selector: {iframe_selector}")
-        sb.switch_to_frame(iframe_selector)
+        # Imported on first use like SeleniumBase itself, so the HTTP-only path never loads Selenium
+        from selenium.common.exceptions import NoSuchFrameException, StaleElementReferenceException, TimeoutException
+        
+        # Only retry the transient races between the iframe becoming visible and the switch;
+        # a wait that already timed out after `timeout` seconds is left to _scrape_single's retry
+        iframe_retry_exceptions = (NoSuchFrameException, StaleElementReferenceException, TimeoutException)
+        for attempt in range(self.IFRAME_SWITCH_ATTEMPTS):
+            try:
+                iframe = sb.wait_for_element_visible(iframe_selector, timeout=timeout)
+                if not iframe:
+                    raise Exception(f"Iframe not found with selector: {iframe_selector}")
+                sb.switch_to_frame(iframe_selector)
+                return
+            except iframe_retry_exceptions:
+                if attempt == self.IFRAME_SWITCH_ATTEMPTS - 1:
+                    raise
+                # Back off 0.5s, then 1s, capped at 2s
+                time.sleep(min(0.5 * 2 ** attempt, 2))
+
+
+    def __enter__(self) -> "ContractsScraper":
+        """Keep pooled browsers open across scrape_contracts calls until the with-block exits."""
+        self._keep_browsers = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """Close every pooled browser."""
+        self._keep_browsers = False
+        self._close_browsers()
+
+    def _launch_browser_session(self, index: int) -> BrowserSession:
+        """
+        Launch and position a new browser.
+        
+        Args:
+            index: The index used to place the browser window
+            
+        Returns:
+            The new browser session
+        """
+        # Imported on first use: SeleniumBase pulls in Selenium and friends (~0.5s), and the
+        # HTTP-first path usually finishes without ever needing a browser
+        from seleniumbase import SB
+        
+        # Enter the SB context manually so the browser outlives a single contract
+        browser_context = SB(
+            # uc=True, 
+            incognito=True
+            )
+        browser_session = BrowserSession(browser_context, browser_context.__enter__())
+        with self._browser_sessions_lock:
+            self._browser_sessions.append(browser_session)
+            # Workers launch browsers concurrently; placement state is shared
+            x, y = self.get_smart_random_position(index)
+        
+        # Configure browser window
+        browser_session.sb.set_window_size(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        browser_session.sb.set_window_position(x, y)
+        return browser_session
+
+    def _prewarm_browser(self, index: int) -> None:
+        """Launch a browser into the idle pool ahead of the first contract, logging instead of raising."""
+        try:
+            self._browser_pool.put(self._launch_browser_session(index))
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not pre-launch browser {index}: {e}")
+
+    def _acquire_browser(self, index: int) -> BrowserSession:
+        """
+        Take an idle browser from the pool, launching a new one if none is idle.
+        
+        Every worker returns its browser before taking the next, so the pool never
+        grows beyond max_workers browsers.
+        
+        Args:
+            index: The index used to place the window if a browser is launched
+            
+        Returns:
+            A browser session reserved for the calling worker
+        """
+        try:
+            return self._browser_pool.get_nowait()
+        except queue.Empty:
+            return self._launch_browser_session(index)
+
+    def _close_browser_context(self, browser_session: BrowserSession) -> None:
+        """Close a pooled browser, logging instead of raising."""
+        try:
+            browser_session.context.__exit__(None, None, None)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error closing browser: {e}")
+
+    def _discard_browser(self, browser_session: BrowserSession) -> None:
+        """Close a browser instead of returning it to the pool, so a broken one is never reused."""
+        with self._browser_sessions_lock:
+            if browser_session in self._browser_sessions:
+                self._browser_sessions.remove(browser_session)
+        self._close_browser_context(browser_session)
+
+    def _close_browsers(self) -> None:
+        """Close every pooled browser once the browser fallback is finished."""
+        with self._browser_sessions_lock:
+            browser_sessions, self._browser_sessions = self._browser_sessions, []
+            self._browser_pool = queue.Queue()
+        for browser_session in browser_sessions:
+            self._close_browser_context(browser_session)
+
+    def _open_search_form(self, sb) -> None:
+        """
+        Load the MTA landing page with a clean session and switch into the contract search iframe.
+        
+        Args:
+            sb: SeleniumBase instance
+        """
+        sb.switch_to_default_content()
+        sb.delete_all_cookies()
+        
+        # Navigate to MTA website
+        sb.open(self.url)
+
+        # Wait for and click the MTA search button
+        sb.wait_for_element_visible(self.xpath_selectors.search_MTA_button, timeout=30).click()
+        
+        # Switch to contract iframe
+        self._find_and_switch_to_iframe(sb, self.xpath_selectors.contract_iframe_tag)
+
+    def _reenter_search_form(self, sb) -> bool:
+        """
+        Switch back into the search iframe left loaded by the worker's previous contract.
+        
+        Args:
+            sb: SeleniumBase instance
+            
+        Returns:
+            True if the contract number input is ready for a new search, False otherwise
+        """
+        try:
+            sb.switch_to_default_content()
+            sb.switch_to_frame(self.xpath_selectors.contract_iframe_tag, timeout=2)
+            sb.wait_for_element_visible(self.xpath_selectors.contract_number_input, timeout=2)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Search form can't be reused, reloading it: {e}")
+            return False
 
+    def _search_and_extract(self, sb, search_term: str) -> Optional[str]:
+        """
+        Search for a contract from the search iframe and extract its form HTML.
+        
+        Args:
+            sb: SeleniumBase instance, switched into the contract search iframe
+            search_term: The contract number to search for
+            
+        Returns:
+            The HTML content of the contract form or None if no match was found
+        """
+        # Imported on first use like SeleniumBase itself, so the HTTP-only path never loads Selenium
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        search_results_heading = './/strong[contains(text(), "Search Results")]'
+        
+        # A reused search form still shows the previous results; keep hold of them so the
+        # results below aren't read from the stale page before the new search replaces it
+        previous_results = sb.find_elements(search_results_heading)
+        
+        # Enter contract number and search
+        sb.type(self.xpath_selectors.contract_number_input, search_term)
+        sb.click(self.xpath_selectors.search_button)
+        if previous_results:
+            WebDriverWait(sb.driver, 30).until(EC.staleness_of(previous_results[0]))
+        
+        # Look for the matching contract link
+        try:
+            sb.wait_for_element_visible(search_results_heading, timeout=30)
+            match_link = sb.is_element_visible(f'.//a[text() = "{search_term.upper()}"]')
+    
+            if not match_link:
+                self.logger.warning(f"⚠️ No match found for contract: {search_term}")
+                return None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error finding contract link for {search_term}: {e}")
+            return None
+        
+        # Click on the matching contract link
+        sb.click(f'.//a[text() = "{search_term.upper()}"]')
+        
+        # Switch to page model iframe
+        self._find_and_switch_to_iframe(sb, self.xpath_selectors.page_model_iframe)
+        
+        # Find and extract the form HTML
+        body_html_tag = sb.find_element(self.xpath_selectors.final_form_tag, timeout=30)
+        if body_html_tag:
+            # The page is server-rendered (no lazy rows to scroll into view); just let its document finish loading
+            sb.wait_for_ready_state_complete(timeout=5)
+            body_html = body_html_tag.get_attribute("outerHTML")
+            self.logger.info(f"Successfully retrieved HTML for contract: {search_term}")
+            return body_html
+        else:
+            self.logger.warning(f"⚠️ Form tag not found for contract: {search_term}")
+            return None
 
     @log_execution_time
     def launch_browser(self, search_term: str, index: int) -> Optional[str]:
         """
-        Launch a browser and navigate to the contract page.
+        Navigate a pooled browser to the contract page.
+        
+        After its first contract, a browser searches again from the search iframe
+        it already has loaded instead of reopening the landing page.
         
         Args:
             search_term: The contract number to search for
@@ -171,69 +407,113 @@ class ContractsScraper:
         Returns:
             The HTML content of the contract page or None if navigation failed
         """
-        # Get position for this browser window
-        x, y = self.get_smart_random_position(index)
-        
+        browser_session = None
         try:
-            with SB(
-                    # uc=True, 
-                    incognito=True
-                    ) as sb:
-                # Configure browser window
-                sb.set_window_size(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
-                sb.set_window_position(x, y)
-                
-                # Log the start of navigation
-                self.logger.info(f"Searching for contract: {search_term}")
-                
-                # Navigate to MTA website
-                sb.open(self.url)
-
-                # Wait for and click the MTA search button
-                sb.wait_for_element_visible(self.xpath_selectors.search_MTA_button, timeout=30).click()
-                
-                # Switch to contract iframe
-                self._find_and_switch_to_iframe(sb, self.xpath_selectors.contract_iframe_tag)
-                
-                # Enter contract number and search
-                sb.type(self.xpath_selectors.contract_number_input, search_term)
-                sb.click(self.xpath_selectors.search_button)
-                
-                # Look for the matching contract link
-                try:
-                    sb.wait_for_element_visible('.//strong[contains(text(), "Search Results")]', timeout=30)
-                    match_link = sb.is_element_visible(f'.//a[text() = "{search_term.upper()}"]')
+            browser_session = self._acquire_browser(index)
+            sb = browser_session.sb
             
-                    if not match_link:
-                        self.logger.warning(f"⚠️ No match found for contract: {search_term}")
-                        return None
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Error finding contract link for {search_term}: {e}")
-                    return None
-                
-                # Click on the matching contract link
-                sb.click(f'.//a[text() = "{search_term.upper()}"]')
-                
-                # Switch to page model iframe
-                self._find_and_switch_to_iframe(sb, self.xpath_selectors.page_model_iframe)
-                
-                # Find and extract the form HTML
-                body_html_tag = sb.find_element(self.xpath_selectors.final_form_tag, timeout=30)
-                if body_html_tag:
-                    sb.sleep(1)
-                    sb.scroll_to_bottom()
-                    sb.sleep(2)
-                    body_html = body_html_tag.get_attribute("outerHTML")
-                    self.logger.info(f"Successfully retrieved HTML for contract: {search_term}")
-                    return body_html
-                else:
-                    self.logger.warning(f"⚠️ Form tag not found for contract: {search_term}")
-                    return None
+            # Log the start of navigation
+            self.logger.info(f"Searching for contract: {search_term}")
+            
+            reuse_search_form = self._search_form_reusable and browser_session.search_form_ready
+            browser_session.search_form_ready = False
+            if not (reuse_search_form and self._reenter_search_form(sb)):
+                reuse_search_form = False
+                self._open_search_form(sb)
+            
+            try:
+                body_html = self._search_and_extract(sb, search_term)
+            except Exception as e:
+                if not reuse_search_form:
+                    raise
+                # The reused page wasn't searchable after all; stop reusing and search from a fresh page
+                self.logger.warning(f"⚠️ Search from the previous page failed for {search_term}, reloading: {e}")
+                self._search_form_reusable = False
+                body_html = None
+            
+            if body_html is None and reuse_search_form:
+                # Don't trust a miss from the reused page; confirm it once from a freshly loaded form
+                self._open_search_form(sb)
+                body_html = self._search_and_extract(sb, search_term)
+            
+            browser_session.search_form_ready = True
+            self._browser_pool.put(browser_session)
+            return body_html
 
         except Exception as e:
             self.logger.error(f"Error in browser automation for {search_term}: {e}")
             self.logger.debug(traceback.format_exc())
+            # The browser may be in a broken state; close it so the next attempt gets a fresh one
+            if browser_session is not None:
+                self._discard_browser(browser_session)
+            return None
+
+    async def _fetch_contract_http(self, session: ClientSession, search_term: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and parse a single contract with plain HTTP requests, without a browser.
+        
+        Concurrent requests are bounded by the page scraper's max_concurrency (http_concurrency).
+        
+        Args:
+            session: Active ClientSession shared by all HTTP fetches
+            search_term: The contract number to search for
+            
+        Returns:
+            A dictionary containing contract information or None if any step failed
+        """
+        search_html = await self.html_page_scraper.request_html(session, contract_name=search_term)
+        if not search_html:
+            return None
+        
+        match_contract = self.html_parser.search_page_parser(search_html, search_term)
+        if not match_contract:
+            self.logger.warning(f"⚠️ No HTTP match found for contract: {search_term}")
             return None
+        
+        detail_html = await self.html_page_scraper.request_html(session, matched_contract=match_contract)
+        if not detail_html:
+            return None
+        
+        # Parse in the default thread pool so outstanding requests keep flowing meanwhile
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.html_parser.final_page_parser, detail_html)
+
+    async def _add_result(self, results: Dict[str, Dict[str, Any]], search_term: str, result: Dict[str, Any]) -> None:
+        """
+        Record a scraped contract, handing it to the save buffer when there is one.
+        
+        Args:
+            results: Dictionary of the run's results, keyed by search term
+            search_term: The contract number that was scraped
+            result: The contract information
+        """
+        results[search_term] = result
+        if self.save_buffer is not None:
+            await self.save_buffer.add(search_term, result)
+
+    async def _scrape_via_http(self, search_terms: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape contracts concurrently over HTTP using a single shared session.
+        
+        Args:
+            search_terms: List of contract numbers to search for
+            
+        Returns:
+            A dictionary mapping each successfully scraped search term to its contract information
+        """
+        async with self.html_page_scraper as page_scraper:
+            http_results = await asyncio.gather(
+                *(self._fetch_contract_http(page_scraper.session, term) for term in search_terms),
+                return_exceptions=True
+            )
+        
+        results = {}
+        for term, result in zip(search_terms, http_results):
+            if isinstance(result, Exception):
+                self.logger.error(f"HTTP fetch failed for contract {term}: {result}")
+            elif result:
+                await self._add_result(results, term, result)
+        return results
 
     def _scrape_single(self, search_term: str, index: int) -> Optional[Dict[str, Any]]:
         """
@@ -266,55 +546,80 @@ class ContractsScraper:
                 self.logger.error(f"Attempt {attempt} failed for contract {search_term}: {e}")
                 self.logger.debug(traceback.format_exc())
                 
-            # Wait before retrying, with increasing delay
+            # Wait before retrying, with increasing delay; jitter keeps workers that failed together
+            # from retrying against the server in lockstep. This runs in a worker thread, so a
+            # blocking sleep leaves the event loop free
             if attempt < self.retry_attempts:
                 retry_delay = 2 ** attempt  # Exponential backoff
-                self.logger.info(f"Retrying in {retry_delay} seconds...")
+                retry_delay += random.uniform(0, retry_delay / 2)
+                self.logger.info(f"Retrying in {retry_delay:.2f} seconds...")
                 time.sleep(retry_delay)
                 
         self.logger.error(f"All attempts failed for contract {search_term}")
-        return {search_term: None}
+        return None
 
-    def scrape_contracts(self, search_terms: List[str]) -> List[Dict[str, Any]]:
+    async def scrape_contracts(self, search_terms: List[str]) -> Dict[str, Dict[str, Any]]:
         """
         Scrape information for multiple contracts concurrently.
         
+        HTTP fetches and the blocking browser fallback share one event loop; browser
+        sessions run in a thread pool bounded by max_workers.
+        
         Args:
             search_terms: List of contract numbers to search for
             
         Returns:
-            A list of dictionaries containing contract information
+            A dictionary mapping each scraped search term to its contract information
         """
         if not search_terms:
             self.logger.warning("No search terms provided")
-            return []
+            return {}
             
-        self.logger.info(f"Starting scraping for {len(search_terms)} contracts with {self.max_workers} workers")
+        # Resolve as many contracts as possible over plain HTTP before launching any browser
+        self.logger.info(f"Starting HTTP scraping for {len(search_terms)} contracts")
+        results = await self._scrape_via_http(search_terms)
         
-        # Reset used positions for window placement
-        self.used_positions = set()
+        browser_terms = [term for term in search_terms if term not in results]
+        if not browser_terms:
+            self.logger.info(f"Completed scraping with {len(results)} successful results out of {len(search_terms)} contracts")
+            return results
         
-        results = {}
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all jobs
-            futures = {
-                executor.submit(self._scrape_single, term, idx): term
-                for idx, term in enumerate(search_terms)
-            }
+        self.logger.info(f"Falling back to browser scraping for {len(browser_terms)} contracts with {self.max_workers} workers")
+        
+        # Reset window placement, unless browsers kept from a previous run still occupy their positions
+        if not self._browser_sessions:
+            self._free_overflow_cells = []
+        self._search_form_reusable = True
+        
+        loop = asyncio.get_running_loop()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Launch the browsers in parallel up front so contracts don't each wait on a cold start
+                await asyncio.gather(*(
+                    loop.run_in_executor(executor, self._prewarm_browser, idx)
+                    for idx in range(len(self._browser_sessions), min(self.max_workers, len(browser_terms)))
+                ))
+                
+                # Run the blocking browser sessions in the pool without blocking the event loop
+                browser_results = await asyncio.gather(
+                    *(loop.run_in_executor(executor, self._scrape_single, term, idx)
+                      for idx, term in enumerate(browser_terms)),
+                    return_exceptions=True
+                )
+        finally:
+            # Browsers stay open across contracts; close them now unless a with-block keeps them for later runs
+            if not self._keep_browsers:
+                self._close_browsers()
             
-            # Process results as they complete
-            for future in as_completed(futures):
-                term = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results[term] = result
-                        self.logger.info(f"Added result for contract {term}")
-                    else:
-                        self.logger.warning(f"⚠️ No result for contract {term}")
-                except Exception as e:
-                    self.logger.error(f"Thread failed for contract {term}: {e}")
-                    self.logger.debug(traceback.format_exc())
+        for term, result in zip(browser_terms, browser_results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Thread failed for contract {term}: {result}")
+                self.logger.debug("".join(traceback.format_exception(result)))
+            elif result:
+                await self._add_result(results, term, result)
+                self.logger.info(f"Added result for contract {term}")
+            else:
+                self.logger.warning(f"⚠️ No result for contract {term}")
         
         self.logger.info(f"Completed scraping with {len(results)} successful results out of {len(search_terms)} contracts")
         return results
@@ -330,10 +635,18 @@ if __name__ == "__main__":
 
     contract_searches = load_input()
 
-    # Initialize scraper with 10 concurrent workers
-    scraper = ContractsScraper(max_workers=10)
-    
+    # uvloop's libuv-based loop is faster for many concurrent sockets; it isn't available on Windows
+    try:
+        from uvloop import run as run_event_loop
+    except ImportError:
+        run_event_loop = asyncio.run
+
+    async def scrape_and_save(search_terms: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Scrape the contracts, appending them to the output file in batches as they're collected."""
+        async with SaveBuffer() as save_buffer:
+            # Initialize scraper with 10 concurrent workers; the with-block closes its pooled browsers when done
+            with ContractsScraper(max_workers=10, save_buffer=save_buffer) as scraper:
+                return await scraper.scrape_contracts(search_terms)
+
     # Scrape contracts
-    results = scraper.scrape_contracts(contract_searches)
-    
-    save_data(results)
\ No newline at end of file
+    results = run_event_loop(scrape_and_save(contract_searches))
\ No newline at end of file
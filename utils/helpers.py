@@ -2,21 +2,22 @@ import os, sys
 # Ensure the project's root directory is in the Python path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-import re, time, json
+import re, time, asyncio, codecs
 import traceback
 from pathlib import Path
+from urllib.parse import urlencode, quote_plus
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
-from parsel import Selector
-from dataclasses import dataclass, field, asdict
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any, Union
+from lxml import etree, html as lxml_html
+from dataclasses import dataclass, field, fields
 from logs.custom_logging import setup_logging
 import aiohttp, logging
+import orjson
 
 # Setup
 logger = setup_logging(console_level=logging.DEBUG)
 
 
-
 # ==========================================
 # DATA CLASSES FOR XPATH SELECTORS
 # ==========================================
@@ -33,6 +34,14 @@ class XpathSelectors:
     page_model_iframe: str = './/iframe[@id="PageModaliFrame"]'
     final_form_tag: str = './/form[@name="PageForm"]'
 
+    # Search Results Selectors
+    search_result_cells: str = './/a[contains(@href, "javascript: ViewDetail")]/..'
+    search_result_name: str = './/text()'
+    search_result_href: str = './/a/@href'
+
+    # Section Table Selectors
+    data_row_cells: str = './tr[position()>1]/td'
+
     # Contract Information Selectors
     contract_description: str = './/td[contains(., "Contract Description")]/following-sibling::td[1]/strong/text()'
     contract_number: str = './/td[contains(., "Contract Number")]/following-sibling::td[1]/strong/text()'
@@ -41,61 +50,27 @@ class XpathSelectors:
     dates: str = './/td[contains(., "Dates")]/following-sibling::td[1]/strong/text()'
     prime_contractor: str = '//td[contains(., "Prime Contractor")]/following-sibling::td[1]/strong/text()'
 
-    # Subcontractor Selectors
-    name: str = './td[1]/table//td[2]//text()'
-    tier: str = './/img[contains(@src, "/images/img_sub_tier_")]/@src'
-    type_of_goal: str = './td[2]/img/@alt'
-    contracted_amount: str = './td[3]/text()'  # Both amount & % included
-    paid_amount: str = './td[4]/text()'
+    # Compiled XPath objects keyed by selector name, built in __post_init__
+    compiled: Dict[str, etree.XPath] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self):
+        """Compile all selectors once; compiled XPath objects are safe to share across threads."""
+        # smart_strings=False returns plain str results instead of ones holding a reference to their
+        # parent element, so extracted values never keep a page's whole tree alive
+        self.compiled = {
+            selector.name: etree.XPath(getattr(self, selector.name), smart_strings=False)
+            for selector in fields(self) if selector.init
+        }
 
 
 # ==========================================
 # DATA CLASSES FOR STORING INFORMATION
 # ==========================================
 
-@dataclass
-class ContractInformation:
-    """Stores information about a contract."""
-    contract_description: str = ''
-    contract_number: str = ''
-    organization: str = ''
-    status: str = ''
-    dates: str = ''
-    prime_contractor: str = ''
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the dataclass instance to a dictionary."""
-        return asdict(self)
-
-
-@dataclass
-class AwardSummary:
-    """Stores award and payment summary information."""
-    award: str = None
-    award_percentage: Optional[str] = None
-    payments: str = None
-    payments_percentage: Optional[str]  = None
-    difference: Optional[str]  = ''
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the dataclass instance to a dictionary."""
-        return asdict(self)
-
-
-@dataclass
-class Subcontractors:
-    """Stores information about a subcontractor."""
-    name: str = ''
-    tier: Optional[int] = None
-    type_of_goal: str = ''
-    included_in_goal: bool = False
-    contracted_amount: Optional[str] = None
-    paid_amount: Optional[str] = None
-    # more_subcontractors: List[Dict[str, Any]] = field(default_factory=list)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the dataclass instance to a dictionary."""
-        return asdict(self)
+class ContractMatch(NamedTuple):
+    """A search result matching the requested contract number."""
+    name: str
+    cid: str
 
 
 
@@ -105,57 +80,181 @@ class Subcontractors:
 
 
 class HtmlParser:
+    # Captions of the tables that precede the data tables on the contract page
+    AWARD_SUMMARY_CAPTION = "Award & Payment Summary"
+    SUBCONTRACTORS_CAPTION = "Subcontractors"
+    # Subcontractor rows carry their tier in an image named like img_sub_tier_2.gif
+    TIER_IMAGE_MARKER = "/images/img_sub_tier_"
+    # Patterns applied per row, compiled once: the tier digit in the image name and the CID in ViewDetail('...')
+    TIER_PATTERN = re.compile(r'_(\d+)\.')
+    CID_PATTERN = re.compile(r"\(\s*[\'\"]([A-Fa-f0-9]+)[\'\"]\s*\)")
+
     def __init__(self):
         self.logger = logger
         self.xpath_selectors = XpathSelectors()
+        self.compiled = self.xpath_selectors.compiled
 
-    def normalize_whitespace(self, text: Optional[str]) -> str:
+    @staticmethod
+    def normalize_whitespace(text: Optional[str]) -> str:
         """Clean up text by removing excessive whitespace."""
-        if text is None:
+        if not text:
             return ''
-        return re.sub(r'\s+', ' ', text).strip()
+        # Fast path: every whitespace char except ' ' is non-printable, so clean text only needs strip()
+        if '  ' not in text and text.isprintable():
+            return text.strip()
+        # str.split() splits on every whitespace char, same as r'\s+', without the regex engine
+        return ' '.join(text.split())
 
+    @staticmethod
+    def parse_html(html_str: Union[str, bytes]) -> lxml_html.HtmlElement:
+        """Parse an HTML page or fragment into an lxml tree rooted at <html>; bytes are read as UTF-8."""
+        if isinstance(html_str, bytes):
+            # lxml decodes the raw body itself, with no intermediate str; a parser costs ~2us
+            # to build, and one per page keeps parse threads from contending on a shared one
+            return lxml_html.document_fromstring(html_str, parser=lxml_html.HTMLParser(encoding='utf-8'))
+        return lxml_html.document_fromstring(html_str)
 
     @staticmethod
-    def organize_subcontractors(temp_subcontractors_list: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _bare_form(root: lxml_html.HtmlElement) -> Optional[lxml_html.HtmlElement]:
+        """Return the contract form if it is the only element of the parsed HTML, as with a form's outerHTML."""
+        body = root.find('body')
+        if body is not None and len(body) == 1:
+            form = body[0]
+            if form.tag == 'form' and form.get('name') == 'PageForm':
+                return form
+        return None
+
+    @staticmethod
+    def first(results: List[Any]) -> Optional[Any]:
+        """Return the first XPath result or None, like Parsel's ``.get()``."""
+        return results[0] if results else None
+
+    @staticmethod
+    def _build_parent_indices(tiers: List[int]) -> List[int]:
         """
-        Organize subcontractors into a hierarchical structure based on tier level.
+        Find the parent row of every subcontractor row from the tier levels alone.
         
         Args:
-            temp_subcontractors_list: List of tuples containing tier level and subcontractor info
+            tiers: Tier level of each row, in table order
             
         Returns:
-            A list of dictionaries with hierarchical subcontractor structure
+            For each row, the index of its parent row or -1 for a top-level row
         """
-        organized_subcontractors = []
+        parent_indices = []
         nesting_stack = []
 
-        for tier_level, subcontractor_info in temp_subcontractors_list:
-            # Create a new node combining subcontractor info and tier level
-            current_node = {**subcontractor_info, "tier": tier_level}
-        
-            # Remove any nodes from the stack that are at the same or deeper level
-            while nesting_stack and nesting_stack[-1]["tier"] >= tier_level:
+        for index, tier_level in enumerate(tiers):
+            # Remove any rows from the stack that are at the same or deeper level
+            while nesting_stack and tiers[nesting_stack[-1]] >= tier_level:
                 nesting_stack.pop()
 
-            if nesting_stack:
-                # If there's a valid parent on the stack, add current node as a child
-                parent_node = nesting_stack[-1] 
+            parent_indices.append(nesting_stack[-1] if nesting_stack else -1)
 
-                if "more_subcontractors" not in parent_node:
-                    parent_node["more_subcontractors"] = []
+            # Push current row onto the stack so it can be a parent to next tier
+            nesting_stack.append(index)
 
-                parent_node["more_subcontractors"].append(current_node)
-            else:
-                # If no valid parent found, this is a top-level (tier 1) subcontractor
-                organized_subcontractors.append(current_node)
+        return parent_indices
 
-            # Push current node onto the stack so it can be a parent to next tier
-            nesting_stack.append(current_node)
+    @staticmethod
+    def organize_subcontractors(temp_subcontractors_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Organize subcontractors into a hierarchical structure based on tier level.
+        
+        Args:
+            temp_subcontractors_list: Subcontractor info dictionaries in table order, each with its "tier"
+            
+        Returns:
+            A list of dictionaries with hierarchical subcontractor structure
+        """
+        parent_indices = HtmlParser._build_parent_indices(
+            [subcontractor_info["tier"] for subcontractor_info in temp_subcontractors_list]
+        )
+
+        organized_subcontractors = []
+        for current_node, parent_index in zip(temp_subcontractors_list, parent_indices):
+            if parent_index < 0:
+                # No parent found, this is a top-level (tier 1) subcontractor
+                organized_subcontractors.append(current_node)
+            else:
+                # The row dicts are freshly built per page, so nest them in place instead of copying
+                temp_subcontractors_list[parent_index].setdefault("more_subcontractors", []).append(current_node)
 
         return organized_subcontractors
     
-    def search_page_parser(self, html_str: str, search_term: str) -> Optional[Dict[str, str]]:
+    def _index_section_tables(self, form: lxml_html.HtmlElement) -> Dict[str, List[lxml_html.HtmlElement]]:
+        """
+        Locate the data tables of every section in a single pass over the form's tables.
+        
+        A data table is the first sibling table following any table whose text contains
+        the section caption. Each table's text is computed once and checked against all
+        captions, instead of re-scanning the whole form once per section. A nested table's
+        text is part of its parent table's, so it is only checked for the captions its
+        parent contains, and skipped entirely when the parent contains none.
+        
+        Args:
+            form: lxml element of the contract form
+            
+        Returns:
+            A dictionary mapping each section caption to its data tables in document order
+        """
+        section_tables = {caption: [] for caption in (self.AWARD_SUMMARY_CAPTION, self.SUBCONTRACTORS_CAPTION)}
+        captions_in_table = {}
+        table_positions = {}
+
+        for position, table in enumerate(form.iter('table')):
+            table_positions[table] = position
+            parent_table = next(table.iterancestors('table'), None)
+            candidate_captions = captions_in_table.get(parent_table, section_tables.keys())
+            if not candidate_captions:
+                captions_in_table[table] = ()
+                continue
+
+            table_text = table.text_content()
+            captions_in_table[table] = found_captions = [
+                caption for caption in candidate_captions if caption in table_text
+            ]
+            for caption in found_captions:
+                data_tables = section_tables[caption]
+                data_table = next(table.itersiblings('table'), None)
+                if data_table is not None and data_table not in data_tables:
+                    data_tables.append(data_table)
+
+        # Captions are matched outer table first, so an outer layout table's data table can be found
+        # before the ones nested inside it; rows must come out in document order like the XPath union did
+        for data_tables in section_tables.values():
+            data_tables.sort(key=table_positions.__getitem__)
+        return section_tables
+
+    @staticmethod
+    def _data_rows(data_tables: List[lxml_html.HtmlElement]) -> List[lxml_html.HtmlElement]:
+        """Return the rows of the given tables in document order, skipping each table's header row."""
+        data_rows = [tr_tag for table in data_tables for tr_tag in table.findall('tr')[1:]]
+        # The tables are in document order, so their rows are too, unless a data table sits inside
+        # another one's rows; only then walk the document to interleave them like the XPath union did
+        data_table_set = set(data_tables)
+        if any(parent in data_table_set for table in data_tables for parent in table.iterancestors('table')):
+            data_row_set = set(data_rows)
+            data_rows = [tr_tag for tr_tag in data_tables[0].getroottree().iter('tr') if tr_tag in data_row_set]
+        return data_rows
+
+    def _iter_search_results(self, html_str: Union[str, bytes]):
+        """Yield a ContractMatch for every result row of a search page, skipping malformed rows."""
+        root = self.parse_html(html_str)
+        td_tags = self.compiled['search_result_cells'](root)
+        
+        for td_tag in td_tags:
+            try:
+                contract_name = self.normalize_whitespace(self.first(self.compiled['search_result_name'](td_tag)))
+                contract_href = self.first(self.compiled['search_result_href'](td_tag)) or ''
+                # The CID capture group only matches hex digits, so it needs no whitespace cleanup
+                contract_cid = self.CID_PATTERN.findall(contract_href)[0]
+                yield ContractMatch(contract_name, contract_cid)
+
+            except Exception as e:
+                self.logger.warning(f"⚠️ Error processing search result: {e}")
+                continue
+
+    def search_page_parser(self, html_str: Union[str, bytes], search_term: str) -> Optional[ContractMatch]:
         """
         Parse search results page to find matching contracts.
         
@@ -164,24 +263,12 @@ class HtmlParser:
             search_term: The term to search for in contract names
             
         Returns:
-            A dictionary mapping contract name to contract ID, or None if no match found
+            The matching contract's name and CID, or None if no match found
         """
         try:
-            selector = Selector(html_str)
-            td_tags = selector.xpath('.//a[contains(@href, "javascript: ViewDetail")]/..')
-            
-            for td_tag in td_tags:
-                try:
-                    contract_name = self.normalize_whitespace(td_tag.xpath('.//text()').get())
-                    contract_cid = self.normalize_whitespace(td_tag.xpath('.//a/@href').re(r"\(\s*[\'\"]([A-Fa-f0-9]+)[\'\"]\s*\)")[0])
-                    
-                    if search_term.upper() == contract_name.upper():
-                        return {contract_name : contract_cid}
-                    else: None
-
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Error processing search result: {e}")
-                    continue
+            for match in self._iter_search_results(html_str):
+                if search_term.upper() == match.name.upper():
+                    return match
 
             return None
         
@@ -190,7 +277,25 @@ class HtmlParser:
             self.logger.debug(traceback.format_exc())
             return None
 
-    def final_page_parser(self, html_str: str) -> Optional[Dict[str, Any]]:
+    def search_list_parser(self, html_str: Union[str, bytes]) -> Dict[str, ContractMatch]:
+        """
+        Parse a page of the unfiltered contract listing.
+        
+        Args:
+            html_str: The HTML content of a listing page
+            
+        Returns:
+            A dictionary mapping upper-cased contract name to its match, empty if parsing failed
+        """
+        try:
+            return {match.name.upper(): match for match in self._iter_search_results(html_str)}
+        
+        except Exception as e:
+            self.logger.error(f"❌ Error parsing contract list page: {e}")
+            self.logger.debug(traceback.format_exc())
+            return {}
+
+    def final_page_parser(self, html_str: Union[str, bytes]) -> Optional[Dict[str, Any]]:
         """
         Extract contract information from the HTML content.
         
@@ -206,19 +311,30 @@ class HtmlParser:
             return None
             
         try:
-            selector = Selector(html_str)
-            form_html = selector.xpath(self.xpath_selectors.final_form_tag)
+            root = self.parse_html(html_str)
+            # The browser fallback hands over just the form's outerHTML; only search full pages for it
+            form_html = self._bare_form(root)
+            if form_html is None:
+                form_html = self.first(self.compiled['final_form_tag'](root))
+            if form_html is None:
+                self.logger.error("❌ Contract form not found in HTML content")
+                return None
             
             # Extract contract information
             contract_info_result = self._extract_contract_info(form_html)
             if not contract_info_result:
                 return None
                 
+            # Locate the award summary and subcontractors tables in one pass
+            section_tables = self._index_section_tables(form_html)
+
             # Extract award summary
-            award_summary_result = self._extract_award_summary(form_html)
+            award_summary_result = self._extract_award_summary(section_tables[self.AWARD_SUMMARY_CAPTION])
                 
             # Extract subcontractors
-            subcontractors_results = self._extract_subcontractors(form_html)
+            subcontractors_results = self._extract_subcontractors(
+                self._data_rows(section_tables[self.SUBCONTRACTORS_CAPTION])
+            )
             
             return {
                 "contract_info": contract_info_result,
@@ -231,48 +347,42 @@ class HtmlParser:
             self.logger.debug(traceback.format_exc())
             return None
 
-    def _extract_contract_info(self, selector: Selector) -> Optional[Dict[str, Any]]:
+    def _extract_contract_info(self, form: lxml_html.HtmlElement) -> Optional[Dict[str, Any]]:
         """
         Extract basic contract information.
         
         Args:
-            selector: Parsel Selector object for the HTML content
+            form: lxml element of the contract form
             
         Returns:
             A dictionary containing contract information or None if extraction failed
         """
         try:
-            store_contract_info = ContractInformation()
+            contract_info = {}
 
             # Extract each field with error handling
-            for field, xpath in [
-                ('contract_description', self.xpath_selectors.contract_description),
-                ('contract_number', self.xpath_selectors.contract_number),
-                ('organization', self.xpath_selectors.organization),
-                ('status', self.xpath_selectors.status),
-                ('dates', self.xpath_selectors.dates),
-                ('prime_contractor', self.xpath_selectors.prime_contractor)
-            ]:
+            for field in ('contract_description', 'contract_number', 'organization',
+                          'status', 'dates', 'prime_contractor'):
                 try:
-                    value = selector.xpath(xpath).get()
-                    setattr(store_contract_info, field, self.normalize_whitespace(value))
+                    value = self.first(self.compiled[field](form))
+                    contract_info[field] = self.normalize_whitespace(value)
                 except Exception as e:
                     self.logger.warning(f"⚠️ Error extracting {field}: {e}")
-                    setattr(store_contract_info, field, '')
+                    contract_info[field] = ''
 
-            return store_contract_info.to_dict()
+            return contract_info
 
         except Exception as e:
             self.logger.error(f"❌ Error parsing contract information: {e}")
             self.logger.debug(traceback.format_exc())
             return None
 
-    def _extract_award_summary(self, selector: Selector) -> Dict[str, Dict[str, Any]]:
+    def _extract_award_summary(self, data_tables: List[lxml_html.HtmlElement]) -> Dict[str, Dict[str, Any]]:
         """
         Extract award summary information.
         
         Args:
-            selector: Parsel Selector object for the HTML content
+            data_tables: Data tables of the award summary section
             
         Returns:
             A dictionary mapping award categories to their details
@@ -280,46 +390,59 @@ class HtmlParser:
         award_summary_result = {}
         
         try:
-            tr_tags = selector.xpath('.//table[contains(., "Award & Payment Summary")]/following-sibling::table[1]/tr[position() > 1]')
+            # One XPath call per table returns every data cell; grouping them by parent row
+            # rebuilds the rows without a findall per row
+            rows_text = {}
+            for data_table in data_tables:
+                for td_tag in self.compiled['data_row_cells'](data_table):
+                    rows_text.setdefault(td_tag.getparent(), []).append(
+                        self.normalize_whitespace(td_tag.text_content())
+                    )
 
-            for tr_tag in tr_tags:
-                td_tags_text = [self.normalize_whitespace(td_tag.xpath('string()').get()) 
-                               for td_tag in tr_tag.xpath('./td')]
-                
+            # Read the rows back in document order, so a later row wins a repeated category as before
+            for tr_tag in self._data_rows(data_tables):
+                td_tags_text = rows_text.get(tr_tag)
                 # Skip empty rows or rows with no first column value
                 if not td_tags_text or not td_tags_text[0]:
                     continue
                     
                 key_name = td_tags_text[0].lower().replace(' ', '_')
                 
-                try:
-                    store_award_summary = AwardSummary(
-                        award=td_tags_text[1] if len(td_tags_text) > 1 else None,
-                        award_percentage=td_tags_text[2] if len(td_tags_text) > 2 else None,
-                        payments=td_tags_text[3] if len(td_tags_text) > 3 else None,
-                        payments_percentage=td_tags_text[4] if len(td_tags_text) > 4 else None,
-                        difference=td_tags_text[5] if len(td_tags_text) > 5 else ''
-                    )
-                    
-                    award_summary_result[key_name] = store_award_summary.to_dict()
-
-                except Exception as e:
-                    self.logger.error(f"❌ Error parsing award row {td_tags_text}: {e}")
+                award_summary_result[key_name] = {
+                    "award": td_tags_text[1] if len(td_tags_text) > 1 else None,
+                    "award_percentage": td_tags_text[2] if len(td_tags_text) > 2 else None,
+                    "payments": td_tags_text[3] if len(td_tags_text) > 3 else None,
+                    "payments_percentage": td_tags_text[4] if len(td_tags_text) > 4 else None,
+                    "difference": td_tags_text[5] if len(td_tags_text) > 5 else ''
+                }
 
             return award_summary_result    
         except Exception as e:
             self.logger.error(f"❌ Error extracting award summary: {e}")
             self.logger.debug(traceback.format_exc())
-            return []
+            return {}
 
         
 
-    def _extract_subcontractors(self, selector: Selector) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _direct_texts(cell: Optional[lxml_html.HtmlElement]) -> List[str]:
+        """Return the text nodes directly under a cell, like XPath ``./text()``."""
+        if cell is None:
+            return []
+        return [text for text in [cell.text, *(child.tail for child in cell)] if text]
+
+    def _format_amount(self, amount_texts: List[str]) -> Optional[str]:
+        """Format an amount cell's two text nodes as "amount (percentage)", or None if incomplete."""
+        if len(amount_texts) != 2:
+            return None
+        return f"{self.normalize_whitespace(amount_texts[0])} ({self.normalize_whitespace(amount_texts[1])})"
+
+    def _extract_subcontractors(self, tr_tags: List[lxml_html.HtmlElement]) -> List[Dict[str, Any]]:
         """
         Extract subcontractor information.
         
         Args:
-            selector: Parsel Selector object for the HTML content
+            tr_tags: Data rows of the subcontractors table
             
         Returns:
             A list of dictionaries containing subcontractor information
@@ -327,41 +450,44 @@ class HtmlParser:
         temp_subcontractors_list = []
         
         try:
-            # Get all tr tags except header
-            tr_tags = selector.xpath('.//table[contains(., "Subcontractors")]/following-sibling::table[1]/tr[position() > 1]')
-
             for tr_tag in tr_tags:
             
                 try:
-                    store_subcontractor = Subcontractors()
-
-                    # Extract name - join all text nodes and clean
-                    name_texts = tr_tag.xpath(self.xpath_selectors.name).getall()
-                    store_subcontractor.name = self.normalize_whitespace(''.join(name_texts))
+                    # Fetch the row's cells once and demux by position:
+                    # td[1] name (+ tier image), td[2] goal image, td[3] contracted, td[4] paid
+                    cells = tr_tag.findall('td')
+                    cells += [None] * (4 - len(cells))
+                    name_cell, goal_cell, contracted_cell, paid_cell = cells[:4]
+
+                    # Extract name - text_content() concatenates each cell's text in C, one string per cell
+                    name_text = '' if name_cell is None else ''.join(
+                        td.text_content() for td in name_cell.iterfind('table//td[2]')
+                    )
                     
                     # Extract tier level from image src
-                    tier = tr_tag.xpath(self.xpath_selectors.tier).re(r'_(\d+)\.')
-                    store_subcontractor.tier = int(tier[0]) if tier else 1
+                    tier_src = next(
+                        (src for src in (img.get('src') for img in tr_tag.iter('img'))
+                         if src and self.TIER_IMAGE_MARKER in src),
+                        None
+                    )
+                    tier_match = self.TIER_PATTERN.search(tier_src) if tier_src else None
+                    tier_level = int(tier_match.group(1)) if tier_match else 1
 
                     # Extract type of goal from alt text
-                    type_of_goal = tr_tag.xpath(self.xpath_selectors.type_of_goal).get()
-                    store_subcontractor.type_of_goal = type_of_goal if type_of_goal else ''
-                    store_subcontractor.included_in_goal = bool(type_of_goal)
-
-                    # Extract contracted amount
-                    contracted_amount = tr_tag.xpath(self.xpath_selectors.contracted_amount).getall()
-                    if contracted_amount and len(contracted_amount) == 2:
-                        store_subcontractor.contracted_amount = f"{self.normalize_whitespace(contracted_amount[0])} ({self.normalize_whitespace(contracted_amount[1])})"
-                    
-                    # Extract paid amount
-                    paid_amount = tr_tag.xpath(self.xpath_selectors.paid_amount).getall()
-                    if paid_amount and len(paid_amount) == 2:
-                        store_subcontractor.paid_amount = f"{self.normalize_whitespace(paid_amount[0])} ({self.normalize_whitespace(paid_amount[1])})"
-
-                    # Add to temporary list with tier level
-                    temp_subcontractors_list.append(
-                        (store_subcontractor.tier, store_subcontractor.to_dict())
+                    type_of_goal = None if goal_cell is None else next(
+                        (img.get('alt') for img in goal_cell.iterfind('img') if img.get('alt') is not None),
+                        None
                     )
+
+                    # Add to temporary list; organize_subcontractors nests rows by their "tier"
+                    temp_subcontractors_list.append({
+                        "name": self.normalize_whitespace(name_text),
+                        "tier": tier_level,
+                        "type_of_goal": type_of_goal if type_of_goal else '',
+                        "included_in_goal": bool(type_of_goal),
+                        "contracted_amount": self._format_amount(self._direct_texts(contracted_cell)),
+                        "paid_amount": self._format_amount(self._direct_texts(paid_cell))
+                    })
                         
                 except Exception as e:
                     self.logger.error(f"❌ Error parsing subcontractor row: {e}")
@@ -381,11 +507,42 @@ class HtmlParser:
 # Html Page Scraper class for requesting html using reverse engineering.
 # ========================================================================
 class HtmlPageScraper:
-    """Class for making HTTP requests to fetch contract information from the website."""
+    """
+    Class for making HTTP requests to fetch contract information from the website.
     
-    def __init__(self):
-        """Initialize the HtmlPageScraper with necessary URLs, headers and request parameters."""
+    Used as an async context manager it owns one pooled ClientSession, so every search
+    POST and detail GET of a run reuses the same keep-alive connections:
+    
+        async with HtmlPageScraper() as page_scraper:
+            html = await page_scraper.request_html(page_scraper.session, contract_name="e30645")
+    """
+    
+    def __init__(self, limit: int = 100, limit_per_host: int = 20, max_concurrency: int = 20,
+                 page_cache_dir: Optional[str] = None):
+        """
+        Initialize the HtmlPageScraper with necessary URLs, headers and request parameters.
+        
+        Args:
+            limit: Maximum number of open connections in the session's pool
+            limit_per_host: Maximum number of open connections to the MTA host
+            max_concurrency: Maximum number of requests in flight at once, however many
+                callers gather; extra requests wait their turn instead of piling onto the server
+            page_cache_dir: Folder to keep detail pages in between runs; pages the server sent an
+                ETag or Last-Modified for are revalidated with a conditional GET (None disables it)
+        """
         self.logger = logger
+        self.page_cache_dir = Path(page_cache_dir) if page_cache_dir else None
+        # CID -> {"etag", "last_modified", "html_path"}, loaded by __aenter__ and saved by __aexit__
+        self._page_cache_index: Dict[str, Dict[str, Optional[str]]] = {}
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.max_concurrency = max_concurrency
+        self._request_semaphore = asyncio.Semaphore(max_concurrency)
+        # Created by __aenter__ and closed by __aexit__
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._resolver: Optional[aiohttp.abc.AbstractResolver] = None
+        # Requests in flight keyed by what they fetch, so concurrent duplicates share one round trip
+        self._inflight_requests: Dict[Tuple[str, str], asyncio.Task] = {}
         self.search_api = "https://mta.newnycontracts.com/FrontEnd/ContractSearchPublic.asp"
         self.base_url = "https://mta.newnycontracts.com/FrontEnd/ContractSearchPublicDetail.asp?XID=788&TN=mta&CID="
         self.form_data = {
@@ -397,11 +554,21 @@ class HtmlPageScraper:
             'ContractNumber': None,
             'ContractStatus': '1',
         }
+        # Searches only differ in ContractNumber: url-encode the other fields once, and build each
+        # request's body from a copy so concurrent searches never share (or overwrite) form state
+        self._search_form_prefix = urlencode(
+            {key: value for key, value in self.form_data.items() if key != 'ContractNumber'}
+        )
         self.params = {
             'XID': '5421',
             'TN': 'mta',
         }
+        # The query string never changes: encode it once, so a search URL is a string whose
+        # parse yarl caches, instead of merging params into the URL on every POST
+        self._search_query = urlencode(self.params)
         
+        # No Accept-Encoding here on purpose: aiohttp advertises every codec it can decode
+        # (gzip and deflate, plus br once Brotli is installed) and decompresses the body itself
         self.get_req_header = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:138.0) Gecko/20100101 Firefox/138.0',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -437,78 +604,325 @@ class HtmlPageScraper:
             'Pragma': 'no-cache',
             'Cache-Control': 'no-cache',
         }
+
+    @staticmethod
+    def _make_resolver() -> Optional[aiohttp.abc.AbstractResolver]:
+        """
+        Build a c-ares resolver when aiodns is installed, so DNS lookups run on the event loop.
+        
+        Returns:
+            An AsyncResolver, or None to keep aiohttp's default getaddrinfo thread resolver
+            (aiodns is optional, and needs a selector event loop on Windows)
+        """
+        try:
+            return aiohttp.AsyncResolver()
+        except RuntimeError:
+            return None
+
+    async def __aenter__(self) -> "HtmlPageScraper":
+        """Open the pooled session shared by every request of the run."""
+        # A semaphore binds to the loop it is first contended on; each run may use a new loop
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrency)
+        # The connector doesn't close a resolver it was given, so keep it for __aexit__ to close
+        self._resolver = self._make_resolver()
+        # Every request goes to one host: cache its DNS answer and keep idle connections
+        # open between batches instead of paying a new TCP+TLS handshake per request
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            resolver=self._resolver
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=10)
+        )
+        if self.page_cache_dir:
+            self._page_cache_index = await asyncio.to_thread(self._load_page_cache_index)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """Close the pooled session, its connections and its DNS resolver."""
+        await self.session.close()
+        self.session = None
+        if self._resolver is not None:
+            await self._resolver.close()
+            self._resolver = None
+        if self.page_cache_dir:
+            await asyncio.to_thread(self._save_page_cache_index)
+
+    # ==========================================
+    # DETAIL PAGE CACHE
+    # ==========================================
+
+    def _load_page_cache_index(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Load the page cache index, starting empty if it is missing or unreadable."""
+        index_path = self.page_cache_dir / "cache_index.json"
+        if not index_path.exists():
+            return {}
+        try:
+            return orjson.loads(index_path.read_bytes())
+        except orjson.JSONDecodeError:
+            self.logger.warning(f"⚠️ Page cache index {index_path} is not valid JSON. Starting with an empty cache.")
+            return {}
+
+    def _save_page_cache_index(self) -> None:
+        """Write the page cache index, logging instead of raising."""
+        index_path = self.page_cache_dir / "cache_index.json"
+        try:
+            self.page_cache_dir.mkdir(parents=True, exist_ok=True)
+            index_path.write_bytes(orjson.dumps(self._page_cache_index))
+        except Exception as e:
+            self.logger.error(f"❌ Error saving page cache index to {index_path}: {e}")
+            self.logger.debug(traceback.format_exc())
+
+    def _detail_request_headers(self, contract_cid: str) -> Dict[str, str]:
+        """Return the detail GET headers, made conditional on the cached copy of the page if there is one."""
+        cache_entry = self._page_cache_index.get(contract_cid)
+        if not cache_entry:
+            return self.get_req_header
+        
+        headers = dict(self.get_req_header)
+        if cache_entry.get("etag"):
+            headers['If-None-Match'] = cache_entry["etag"]
+        if cache_entry.get("last_modified"):
+            headers['If-Modified-Since'] = cache_entry["last_modified"]
+        return headers
+
+    async def _cache_page(self, contract_cid: str, response: aiohttp.ClientResponse, html_content: bytes) -> None:
+        """Keep a detail page the server sent validators for, so the next run can revalidate it."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not self.page_cache_dir or not (etag or last_modified):
+            return
+        
+        page_path = self.page_cache_dir / f"{contract_cid}.html"
+        try:
+            await asyncio.to_thread(self.page_cache_dir.mkdir, parents=True, exist_ok=True)
+            await asyncio.to_thread(page_path.write_bytes, html_content)
+            self._page_cache_index[contract_cid] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "html_path": str(page_path)
+            }
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not cache page for CID {contract_cid}: {e}")
+
+    async def _read_detail_body(self, contract_cid: str, response: aiohttp.ClientResponse) -> Optional[bytes]:
+        """Read a detail page from the response, or from the cache when the server answered 304 Not Modified."""
+        if response.status == 304:
+            # Unchanged since it was cached: no body was sent
+            return await self._load_cached_page(contract_cid)
+        html_content = await self._read_body(response)
+        if html_content is not None:
+            await self._cache_page(contract_cid, response, html_content)
+        return html_content
+
+    async def _load_cached_page(self, contract_cid: str) -> Optional[bytes]:
+        """Read the cached copy of a page the server answered 304 Not Modified for."""
+        cache_entry = self._page_cache_index.get(contract_cid) or {}
+        try:
+            return await asyncio.to_thread(Path(cache_entry["html_path"]).read_bytes)
+        except (KeyError, OSError) as e:
+            # Forget the entry so the next request downloads the page again
+            self._page_cache_index.pop(contract_cid, None)
+            self.logger.warning(f"⚠️ Cached page for CID {contract_cid} is unavailable: {e}")
+            return None
+        
+    @staticmethod
+    async def _read_body(response: aiohttp.ClientResponse) -> Optional[bytes]:
+        """
+        Read a successful response body as UTF-8 bytes for lxml, without decoding it to str.
+        
+        Like response.text(), a missing or unknown charset is taken as UTF-8; a body
+        declared in another charset is transcoded.
+        
+        Args:
+            response: Response whose body has not been read yet
+            
+        Returns:
+            The body encoded as UTF-8, or None without reading it if the status isn't 200
+        """
+        if response.status != 200:
+            # Don't download the error page; hand the connection straight back to the pool
+            response.release()
+            return None
+        body = await response.read()
+        charset = response.charset
+        try:
+            if charset and codecs.lookup(charset).name != 'utf-8':
+                body = body.decode(charset, errors='replace').encode('utf-8')
+        except LookupError:
+            pass
+        return body
+        
+    async def request_list(self, session: Optional[aiohttp.ClientSession] = None, page: int = 1) -> Optional[bytes]:
+        """
+        Request one page of the unfiltered contract listing (search with a blank contract number).
         
-    async def request_html(self, session: aiohttp.ClientSession, contract_name: str = None, 
-                          matched_contract: Dict[str, str] = None) -> Optional[str]:
+        Args:
+            session: aiohttp ClientSession object for making HTTP requests (defaults to the pooled session)
+            page: 1-based page number of the listing
+            
+        Returns:
+            HTML content as UTF-8 bytes or None if request failed
+        """
+        session = session or self.session
+        log = self.logger
+        try:
+            start_time = time.perf_counter()
+            # Build a per-call form so concurrent page requests don't overwrite each other's fields
+            form_data = {**self.form_data, 'ContractNumber': '', 'PageNumber': str(page)}
+            # Lazy %-style arguments: nothing is formatted unless the record is emitted
+            log.info('Fetching contract list page %d', page)
+            
+            # The response context releases the connection even if reading the body fails
+            async with self._request_semaphore, session.post(
+                f"{self.search_api}?{self._search_query}", 
+                headers=self.post_req_header, 
+                data=form_data
+            ) as response:
+                html_content = await self._read_body(response)
+            
+            # Log performance metrics; the failure line reports the elapsed time too, so the start
+            # time is always taken, but the success line is only formatted when INFO is emitted
+            if response.status == 200:
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "Contract list page %d fetched successfully - Status: %d, Length: %d, Time taken: %.4f seconds",
+                        page, response.status, len(html_content), time.perf_counter() - start_time
+                    )
+                return html_content
+            else:
+                log.error(
+                    "Contract list page %d fetched with issues - Status: %d, Time taken: %.4f seconds",
+                    page, response.status, time.perf_counter() - start_time
+                )
+                return None
+        
+        except aiohttp.ClientError as e:
+            log.error("❌ HTTP client error during fetching contract list page %d: %s", page, e)
+            log.debug(traceback.format_exc())
+            return None
+        except Exception as e:
+            log.error("❌ Unexpected error during fetching contract list page %d: %s", page, e)
+            log.debug(traceback.format_exc())
+            return None
+
+    async def request_html(self, session: Optional[aiohttp.ClientSession] = None, contract_name: str = None, 
+                          matched_contract: ContractMatch = None) -> Optional[bytes]:
         """
         Request HTML content for either a contract search or specific contract detail.
         
+        Concurrent calls for the same search term or contract CID share a single request.
+        
+        Args:
+            session: aiohttp ClientSession object for making HTTP requests (defaults to the pooled session)
+            contract_name: Name of the contract to search for
+            matched_contract: Contract name and CID for detail page
+            
+        Returns:
+            HTML content as UTF-8 bytes or None if request failed
+        """
+        session = session or self.session
+        if contract_name:
+            request_key = ('search', contract_name)
+        elif matched_contract:
+            request_key = ('detail', matched_contract.cid)
+        else:
+            return await self._fetch_html(session, contract_name, matched_contract)
+
+        inflight_request = self._inflight_requests.get(request_key)
+        if inflight_request is None:
+            inflight_request = asyncio.ensure_future(self._fetch_html(session, contract_name, matched_contract))
+            self._inflight_requests[request_key] = inflight_request
+
+            def forget_request(done_request: asyncio.Task) -> None:
+                if self._inflight_requests.get(request_key) is done_request:
+                    del self._inflight_requests[request_key]
+            inflight_request.add_done_callback(forget_request)
+        # Shielded: one waiting caller being cancelled must not cancel the request the others share
+        return await asyncio.shield(inflight_request)
+
+    async def _fetch_html(self, session: aiohttp.ClientSession, contract_name: Optional[str],
+                          matched_contract: Optional[ContractMatch]) -> Optional[bytes]:
+        """
+        Fetch the search page or contract detail page behind request_html.
+        
         Args:
             session: aiohttp ClientSession object for making HTTP requests
             contract_name: Name of the contract to search for
-            matched_contract: Dictionary containing contract name and CID for detail page
+            matched_contract: Contract name and CID for detail page
             
         Returns:
-            HTML content as string or None if request failed
+            HTML content as UTF-8 bytes or None if request failed
         """
+        # Bound once instead of looking up self.logger for each log call of every request
+        log = self.logger
         try:
             start_time = time.perf_counter()
             
             if contract_name:
                 # Handle search request
-                self.form_data['ContractNumber'] = contract_name
-                self.logger.info(f'Fetching search page html for search "{contract_name}"')
+                search_form_body = f"{self._search_form_prefix}&ContractNumber={quote_plus(contract_name)}".encode()
+                log.info('Fetching search page html for search "%s"', contract_name)
                 
-                response = await session.post(
-                    self.search_api, 
+                async with self._request_semaphore, session.post(
+                    f"{self.search_api}?{self._search_query}", 
                     headers=self.post_req_header, 
-                    params=self.params, 
-                    data=self.form_data
-                )
-                html_content = await response.text()
+                    data=search_form_body
+                ) as response:
+                    html_content = await self._read_body(response)
                 
             elif matched_contract:
                 # Handle contract detail request
-                contract_name = matched_contract.get("contract_name")
-                contract_cid_key = matched_contract.get("contract_cid")
+                contract_name, contract_cid_key = matched_contract
                 
                 if contract_cid_key and contract_name:
                     final_url = self.base_url + contract_cid_key
 
-                    self.logger.info(f'Fetching final page html for "{contract_name}"')
+                    log.info('Fetching final page html for "%s"', contract_name)
                     
-                    response = await session.get(final_url, headers=self.get_req_header)
-                    html_content = await response.text()
+                    async with self._request_semaphore:
+                        async with session.get(
+                            final_url, headers=self._detail_request_headers(contract_cid_key)
+                        ) as response:
+                            html_content = await self._read_detail_body(contract_cid_key, response)
+                        if response.status == 304 and html_content is None:
+                            # The cached copy is gone (and its index entry dropped): download the page unconditionally
+                            async with session.get(final_url, headers=self.get_req_header) as response:
+                                html_content = await self._read_detail_body(contract_cid_key, response)
                 else:
-                    self.logger.error("❌ Missing contract name or CID in matched_contract dictionary")
+                    log.error("❌ Missing contract name or CID in matched_contract")
                     return None
             else:
-                self.logger.error("❌ No contract number or matched contract provided")
+                log.error("❌ No contract number or matched contract provided")
                 return None
                 
-            # Calculate and log performance metrics
-            end_time = time.perf_counter()
-            duration = end_time - start_time
-            if response.status == 200:
-                self.logger.info(
-                    f"Page for '{contract_name}' fetched successfully - Status: {response.status}, "
-                    f"Length: {len(html_content)}, Time taken: {duration:.4f} seconds"
-                )
+            # Log performance metrics; the failure line reports the elapsed time too, so the start
+            # time is always taken, but the success line is only formatted when INFO is emitted
+            if html_content is not None:
+                if log.isEnabledFor(logging.INFO):
+                    log.info(
+                        "Page for '%s' fetched successfully - Status: %d, Length: %d, Time taken: %.4f seconds",
+                        contract_name, response.status, len(html_content), time.perf_counter() - start_time
+                    )
                 return html_content
             else:
-                self.logger.error(
-                    f"Page fetched with issues - Status: {response.status}, "
-                    f"Length: {len(html_content)}, Time taken: {duration:.4f} seconds"
+                log.error(
+                    "Page fetched with issues - Status: %d, Time taken: %.4f seconds",
+                    response.status, time.perf_counter() - start_time
                 )
                 return None
         
         except aiohttp.ClientError as e:
-            self.logger.error(f"❌ HTTP client error during fetching: {e}")
-            self.logger.debug(traceback.format_exc())
+            log.error("❌ HTTP client error during fetching: %s", e)
+            log.debug(traceback.format_exc())
             return None
         except Exception as e:
-            self.logger.error(f"❌ Unexpected error during fetching: {e}")
-            self.logger.debug(traceback.format_exc())
+            log.error("❌ Unexpected error during fetching: %s", e)
+            log.debug(traceback.format_exc())
             return None
 
 
@@ -518,10 +932,15 @@ class HtmlPageScraper:
 
 
 
-def save_data(new_data: Dict[str, Dict[str, Any]], filename: str = "contracts_data.json") -> None:
+def _encode_records(new_data: Dict[str, Dict[str, Any]]) -> bytes:
+    """Serialize each search term as its own {search_term: data} JSON line."""
+    return b"".join(orjson.dumps({search_term: data}) + b"\n" for search_term, data in new_data.items())
+
+def save_data(new_data: Dict[str, Dict[str, Any]], filename: str = "contracts_data.jsonl") -> None:
     """
-    Save new scraped contract data to a JSON file.
-    If a key (search term) already exists, its data will be updated.
+    Append new scraped contract data to a JSON Lines file.
+    Each search term is written as its own {search_term: data} line, so a save only
+    serializes the new records; a term saved again is superseded by its latest line (see load_all).
     
     Args:
         new_data: Dictionary with search_term as key and its contract data as value
@@ -531,26 +950,12 @@ def save_data(new_data: Dict[str, Dict[str, Any]], filename: str = "contracts_da
     file_path = Path(base_dir) / filename
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Load existing data if file exists
-    if file_path.exists():
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-        except json.JSONDecodeError:
-            logger.warning("File exists but is not valid JSON. Starting with empty data.")
-            existing_data = {}
-    else:
-        existing_data = {}
-
-    # Merge new data
-    for search_term, data in new_data.items():
-        existing_data[search_term] = data  # Overwrite or add
-
     if new_data:
-        # Save updated data
+        # Append the new records; earlier saves are never re-read or rewritten
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, indent=4, ensure_ascii=False)
+            records = _encode_records(new_data)
+            with open(file_path, "ab") as f:
+                f.write(records)
             logger.info(f"✅ Data saved successfully to '{file_path}'")
         except Exception as e:
             logger.error(f"❌ Error saving data to {file_path}: {e}")
@@ -558,6 +963,112 @@ def save_data(new_data: Dict[str, Dict[str, Any]], filename: str = "contracts_da
     else:
         logger.warning("No new data found for saving!")
 
+class SaveBuffer:
+    """
+    Collect scraped contract data in memory and append it to the output file in batches.
+    
+    The output file is opened once for the lifetime of the async with-block; records are written
+    every flush_every contracts, and whatever is left when the block exits. Opening, writing and
+    closing the file all run in a worker thread, so requests in flight on the event loop never wait on disk:
+    
+        async with SaveBuffer(flush_every=100) as save_buffer:
+            await save_buffer.add(search_term, contract_data)
+    """
+    
+    def __init__(self, filename: str = "contracts_data.jsonl", flush_every: int = 100):
+        """
+        Initialize an empty buffer.
+        
+        Args:
+            filename: Name of the file inside 'output_data' to append to
+            flush_every: Number of buffered records that triggers a write
+        """
+        self.file_path = Path("output_data") / filename
+        self.flush_every = flush_every
+        self.saved_count = 0
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._file = None
+        # Created by __aenter__; keeps batches flushed concurrently from interleaving their writes
+        self._write_lock: Optional[asyncio.Lock] = None
+
+    async def add(self, search_term: str, data: Dict[str, Any]) -> None:
+        """Buffer one contract, writing the batch once it holds flush_every records."""
+        self._pending[search_term] = data
+        if len(self._pending) >= self.flush_every:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Append every buffered contract to the open output file in one write, off the event loop."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, pending)
+
+    def _write(self, pending: Dict[str, Dict[str, Any]]) -> None:
+        """Serialize and append a batch in the calling worker thread, logging instead of raising."""
+        try:
+            self._file.write(_encode_records(pending))
+            # Push the batch to disk now, so a crash later in the run doesn't lose it
+            self._file.flush()
+            self.saved_count += len(pending)
+        except Exception as e:
+            logger.error(f"❌ Error saving data to {self.file_path}: {e}")
+            logger.debug(traceback.format_exc())
+
+    def _open(self) -> None:
+        """Create the output folder and open the output file for appending."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.file_path, "ab")
+
+    async def __aenter__(self) -> "SaveBuffer":
+        """Open the output file for appending."""
+        self._write_lock = asyncio.Lock()
+        await asyncio.to_thread(self._open)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """Write what is still buffered, even if the block raised, so scraped data isn't lost."""
+        try:
+            await self.flush()
+        finally:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+        if self.saved_count:
+            logger.info(f"✅ {self.saved_count} contracts saved successfully to '{self.file_path}'")
+        else:
+            logger.warning("No new data found for saving!")
+
+def load_all(filename: str = "contracts_data.jsonl") -> Dict[str, Dict[str, Any]]:
+    """
+    Load all contract data saved by save_data.
+    
+    Args:
+        filename: Name of the JSON Lines file inside the 'output_data' folder
+        
+    Returns:
+        A dictionary mapping each search term to its most recently saved data
+    """
+    base_dir = "output_data"
+    file_path = Path(base_dir) / filename
+    all_data = {}
+
+    if not file_path.exists():
+        logger.warning(f"Output file not found: {file_path}")
+        return all_data
+
+    # Stream line by line; later lines overwrite earlier ones for the same search term
+    with open(file_path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                all_data.update(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                logger.warning(f"⚠️ Skipping invalid JSON on line {line_number} of {file_path}")
+
+    return all_data
+
 def load_input(filename: str = "input.json") -> Optional[List[str]]:
     """
     Load input search terms from a JSON file.
@@ -586,8 +1097,7 @@ def load_input(filename: str = "input.json") -> Optional[List[str]]:
 
     # Try reading and validating content
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            input_data = json.load(f)
+        input_data = orjson.loads(file_path.read_bytes())
 
         if not isinstance(input_data, list):
             logger.error(f'Invalid format in input file: Expected a list but got {type(input_data).__name__}')
@@ -600,7 +1110,7 @@ def load_input(filename: str = "input.json") -> Optional[List[str]]:
 
         return input_data
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.error("Invalid JSON format in input file.")
         logger.warning("Please make sure the file contains valid JSON syntax.")
         logger.debug(traceback.format_exc())
@@ -615,8 +1125,8 @@ if __name__ == "__main__":
     # Debug 
     import pprint
     html_parser = HtmlParser()
-    with open("debug.html") as f:
-        html_content = f.read()
+    # Raw bytes go straight to lxml's UTF-8 parser, like the bodies fetched by HtmlPageScraper
+    html_content = Path("debug.html").read_bytes()
 
     result = html_parser.final_page_parser(html_content) 
 